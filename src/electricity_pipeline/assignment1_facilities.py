@@ -58,6 +58,21 @@ def slugify(value: str) -> str:
     return value.strip("-")
 
 
+def slugify_series(values: pd.Series) -> pd.Series:
+    """Vectorised equivalent of ``slugify`` for a whole column.
+
+    Runs one compiled-regex sweep through pandas' string accessor instead of
+    a Python-level ``apply`` call per row.
+    """
+    return (
+        values.fillna("")
+        .astype(str)
+        .str.lower()
+        .str.replace(r"[^a-z0-9]+", "-", regex=True)
+        .str.strip("-")
+    )
+
+
 def _standardise_name(name: str) -> str:
     return re.sub(r"\s+", " ", (name or "").strip()).title()
 
@@ -345,7 +360,7 @@ def build_facilities_metadata(config: Assignment1DataConfig, *, skip_geocode: bo
     )
     metadata = metadata.drop_duplicates(subset=["facility_id"])
     metadata = metadata.reset_index(drop=True)
-    metadata["name_key"] = metadata["name_clean"].apply(slugify)
+    metadata["name_key"] = slugify_series(metadata["name_clean"])
     return metadata
 
 
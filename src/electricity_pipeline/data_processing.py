@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Iterable, Iterator, List, Optional
@@ -12,7 +13,7 @@ import pandas as pd
 from .assignment1_facilities import (
     Assignment1DataConfig,
     build_and_store_metadata,
-    slugify,
+    slugify_series,
 )
 
 
@@ -132,6 +133,30 @@ def _ensure_metadata_file(path: Path) -> None:
         build_and_store_metadata(config, skip_geocode=True)
 
 
+def _read_metadata_parquet_cache(csv_path: Path) -> Optional[pd.DataFrame]:
+    """Return the parquet sidecar for *csv_path* if it is still fresh."""
+    parquet_path = csv_path.with_suffix(".parquet")
+    if not parquet_path.exists():
+        return None
+    if parquet_path.stat().st_mtime < csv_path.stat().st_mtime:
+        return None
+    try:
+        return pd.read_parquet(parquet_path)
+    except Exception as exc:
+        logger.warning("Could not read metadata parquet cache %s: %s", parquet_path, exc)
+        return None
+
+
+def _write_metadata_parquet_cache(df: pd.DataFrame, csv_path: Path) -> None:
+    parquet_path = csv_path.with_suffix(".parquet")
+    try:
+        df.to_parquet(parquet_path, index=False)
+        logger.info("Cached facility metadata at %s", parquet_path)
+    except Exception as exc:
+        # pyarrow/fastparquet may be unavailable; CSV parsing still works.
+        logger.warning("Could not write metadata parquet cache %s: %s", parquet_path, exc)
+
+
 def load_facility_metadata(path: Path, auto_build: bool = True) -> pd.DataFrame:
     if not path.exists():
         if not auto_build:
@@ -145,6 +170,9 @@ def load_facility_metadata(path: Path, auto_build: bool = True) -> pd.DataFrame:
                 f"Assignment 1 datasets not found in {path.parent}. "
                 "Ensure the CER CSV files are available."
             ) from exc
+    cached = _read_metadata_parquet_cache(path)
+    if cached is not None:
+        return cached
     df = pd.read_csv(path)
     required_columns = {"facility_id", "name", "latitude", "longitude"}
     missing = required_columns - set(df.columns)
@@ -153,10 +181,36 @@ def load_facility_metadata(path: Path, auto_build: bool = True) -> pd.DataFrame:
     if "name_clean" not in df.columns:
         df["name_clean"] = df["name"].astype(str).str.strip().str.title()
     if "name_key" not in df.columns:
-        df["name_key"] = df["name_clean"].apply(slugify)
+        df["name_key"] = slugify_series(df["name_clean"])
+    # Low-cardinality labels as category dtype: integer codes instead of
+    # per-cell Python strings for every downstream merge/unique/map.
+    for column in ("fuel_type", "network_region", "status"):
+        if column in df.columns:
+            df[column] = df[column].astype("category")
+    _write_metadata_parquet_cache(df, path)
     return df
 
 
+@lru_cache(maxsize=4)
+def _cached_load_metadata(path_str: str, mtime: float) -> pd.DataFrame:
+    # mtime participates in the cache key so edits to the CSV invalidate
+    # the memoized frame on the next call.
+    return load_facility_metadata(Path(path_str))
+
+
+def load_facility_metadata_cached(path: Path) -> pd.DataFrame:
+    """Memoized `load_facility_metadata`, keyed on the file's path and mtime.
+
+    Callers must treat the returned frame as read-only (or copy it) since
+    the same object is shared across calls.
+    """
+    if not path.exists():
+        # Let load_facility_metadata auto-build the file first; cache only
+        # once there is an mtime to key on.
+        return load_facility_metadata(path)
+    return _cached_load_metadata(str(path), path.stat().st_mtime)
+
+
 def _derive_name_key(df: pd.DataFrame) -> pd.Series:
     name_source = None
     for candidate in ("name", "facility_name"):
@@ -167,7 +221,7 @@ def _derive_name_key(df: pd.DataFrame) -> pd.Series:
         name_source = df["facility_id"]
     if name_source is None:
         name_source = pd.Series(index=df.index, dtype=str)
-    return name_source.fillna("").astype(str).apply(slugify)
+    return slugify_series(name_source)
 
 
 def merge_with_metadata(
@@ -178,7 +232,7 @@ def merge_with_metadata(
 
     metadata = metadata.copy()
     if "name_key" not in metadata.columns:
-        metadata["name_key"] = metadata["name"].astype(str).apply(slugify)
+        metadata["name_key"] = slugify_series(metadata["name"])
     metadata_name_lookup = (
         metadata.drop_duplicates(subset=["name_key"], keep="first")
         .set_index("name_key")
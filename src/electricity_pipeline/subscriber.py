@@ -3,8 +3,8 @@ from __future__ import annotations
 import json
 import logging
 import threading
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime
 from typing import Callable, Optional
 
 import pandas as pd
@@ -15,6 +15,8 @@ from .config import MqttConfig
 
 logger = logging.getLogger(__name__)
 
+NUMERIC_FIELDS = ("power", "emissions", "price", "demand")
+
 
 def _parse_message(payload: str) -> Optional[dict]:
     try:
@@ -23,34 +25,61 @@ def _parse_message(payload: str) -> Optional[dict]:
         logger.warning("Discarding invalid JSON payload: %s", payload)
         return None
     if "timestamp" in message:
+        # Parse once at ingest so downstream consumers never re-run
+        # pd.to_datetime over the accumulated history.
         try:
-            message["timestamp"] = datetime.fromisoformat(
+            message["timestamp"] = pd.Timestamp(
                 message["timestamp"].replace("Z", "+00:00")
             )
-        except ValueError:
+        except (TypeError, ValueError):
             logger.warning("Invalid timestamp in message: %s", payload)
             return None
+    for field_name in NUMERIC_FIELDS:
+        if field_name in message and message[field_name] is not None:
+            try:
+                message[field_name] = float(message[field_name])
+            except (TypeError, ValueError):
+                logger.warning(
+                    "Invalid numeric value for %s in message: %s", field_name, payload
+                )
+                message[field_name] = None
     return message
 
 
 @dataclass
 class MessageStore:
+    """Bounded ring buffer of parsed MQTT messages.
+
+    Appends are O(1) deque pushes; the old implementation re-concatenated a
+    DataFrame per message, making every append O(N). The lock is held only
+    for the brief deque copy, and the DataFrame is materialised outside it.
+    """
+
+    maxlen: int = 10_000
     _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
-    _data: Optional[pd.DataFrame] = field(default=None, init=False)
+    _rows: deque = field(init=False)
+    _version: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        self._rows = deque(maxlen=self.maxlen)
 
     def append(self, message: dict) -> None:
         with self._lock:
-            row = pd.DataFrame([message])
-            if self._data is None:
-                self._data = row
-            else:
-                self._data = pd.concat([self._data, row], ignore_index=True)
+            self._rows.append(message)
+            self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Monotonic ingest counter; lets consumers skip unchanged snapshots."""
+        with self._lock:
+            return self._version
 
     def snapshot(self) -> pd.DataFrame:
         with self._lock:
-            if self._data is None:
-                return pd.DataFrame()
-            return self._data.copy()
+            rows = list(self._rows)
+        if not rows:
+            return pd.DataFrame()
+        return pd.DataFrame(rows)
 
 
 class MqttSubscriber: